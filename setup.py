@@ -1,3 +1,6 @@
+import os
+import sys
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -6,6 +9,21 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Opt-in ahead-of-time compilation of the client with mypyc (needs mypy[mypyc]).
+# Without MCP_CLIENT_MYPYC set the package installs as pure Python.
+ext_modules = []
+if os.getenv("MCP_CLIENT_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            # Type-check for the interpreter the extension is being built for
+            "--python-version",
+            f"{sys.version_info.major}.{sys.version_info.minor}",
+            "src/mcp_client/client.py",
+        ]
+    )
+
 setup(
     name="mcp-client-python",
     version="1.0.0",
@@ -37,6 +55,7 @@ setup(
     ],
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
@@ -48,6 +67,7 @@ setup(
             "mypy>=1.0",
             "pytest-cov>=4.0",
         ],
+        "speedups": ["aiohttp[speedups]"],
     },
     entry_points={
         "console_scripts": [
@@ -8,40 +8,92 @@ import json
 import re
 import sys
 import os
-from typing import Any, Dict, List, Optional
-import aiohttp
-from dataclasses import dataclass
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from dataclasses import dataclass, field
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+if TYPE_CHECKING:
+    # Importing the MCP SDK is slow; only pay for it where a session is created
+    from mcp import ClientSession
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older versions keep a per-instance dict
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     role: str  # "user" or "assistant"
     content: str
+    nbytes: int = field(init=False)  # UTF-8 size of content
+
+    def __post_init__(self) -> None:
+        self.nbytes = len(self.content.encode("utf-8"))
 
 
 class CustomMCPClient:
-    def __init__(self, llm_backend):
-        self.session: Optional[ClientSession] = None
+    def __init__(self, llm_backend: Any) -> None:
+        self.session: Optional["ClientSession"] = None
         self.llm_backend = llm_backend
-        self.tools = {}
-        self.conversation_history: List[Message] = []
-        self.max_history = 20
+        self.tools: Dict[str, Any] = {}
+        self._max_history = 20
+        # Bounded so appends evict the oldest message instead of growing forever
+        self.conversation_history: Deque[Message] = deque(maxlen=self._max_history)
+        self.max_history_bytes = 64 * 1024
+        self._history_bytes = 0
+
+    @property
+    def max_history(self) -> int:
+        return self._max_history
+
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"max_history must be >= 0, got {value}")
+        # A deque's maxlen is fixed, so rebuild it keeping the newest messages
+        self._max_history = value
+        self.conversation_history = deque(self.conversation_history, maxlen=value)
+        self._history_bytes = sum(m.nbytes for m in self.conversation_history)
 
     async def load_tools(self):
         """Load available tools from the MCP server"""
         try:
             tools_response = await self.session.list_tools()
             
-            print(f"📚 Found {len(tools_response.tools)} tools:")
+            lines = [f"📚 Found {len(tools_response.tools)} tools:"]
             for tool in tools_response.tools:
                 self.tools[tool.name] = tool
-                print(f"  - {tool.name}: {tool.description}")
-                
+                lines.append(f"  - {tool.name}: {tool.description}")
+            print("\n".join(lines))
+
         except Exception as e:
             print(f"❌ Failed to load tools: {e}")
 
+    def append_message(self, role: str, content: str) -> Message:
+        """Add a message to history, evicting the oldest ones over the byte budget
+
+        Appending to conversation_history directly bypasses the byte budget.
+        """
+        message = Message(role, content)
+        history = self.conversation_history
+        if history and len(history) == history.maxlen:
+            # The deque drops its leftmost entry on append; keep the count in step
+            self._history_bytes -= history[0].nbytes
+        history.append(message)
+        if history:  # With maxlen=0 the deque keeps nothing
+            self._history_bytes += message.nbytes
+
+        # Always keep the newest message, even if it alone exceeds the budget
+        while self._history_bytes > self.max_history_bytes and len(history) > 1:
+            self._history_bytes -= history.popleft().nbytes
+        return message
+
+    def clear_history(self):
+        """Drop all conversation history"""
+        self.conversation_history.clear()
+        self._history_bytes = 0
+
     # Add all other methods from our complete client implementation
     # (This is abbreviated for space - use the full version from our artifacts)
@@ -0,0 +1,133 @@
+"""Tests for the core MCP client"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import mcp_client
+from mcp_client.client import CustomMCPClient, Message
+
+
+def assert_bytes_in_step(client):
+    history = client.conversation_history
+    assert client._history_bytes == sum(m.nbytes for m in history)
+
+
+def test_message_nbytes_is_derived_from_content():
+    assert Message("user", "hello").nbytes == 5
+    assert Message("user", "héllo ☸").nbytes == len("héllo ☸".encode("utf-8"))
+
+
+def test_maxlen_eviction_keeps_byte_count():
+    client = CustomMCPClient(None)
+    for i in range(50):
+        client.append_message("user", f"{i:03d}" + "x" * 97)
+
+    assert len(client.conversation_history) == client.max_history
+    assert client.conversation_history[0].content.startswith("030")
+    assert client._history_bytes == client.max_history * 100
+    assert_bytes_in_step(client)
+
+
+def test_byte_budget_evicts_oldest_messages():
+    client = CustomMCPClient(None)
+    client.max_history_bytes = 250
+    for i in range(5):
+        client.append_message("user", str(i) * 100)
+
+    assert [m.content[0] for m in client.conversation_history] == ["3", "4"]
+    assert client._history_bytes == 200
+    assert_bytes_in_step(client)
+
+
+def test_message_larger_than_budget_is_kept_alone():
+    client = CustomMCPClient(None)
+    for _ in range(50):
+        client.append_message("user", "x" * 100)
+    client.append_message("assistant", "y" * 70000)
+
+    assert len(client.conversation_history) == 1
+    assert client.conversation_history[0].role == "assistant"
+    assert client._history_bytes == 70000
+    assert_bytes_in_step(client)
+
+    client.append_message("user", "z" * 10)
+    assert [m.content[0] for m in client.conversation_history] == ["z"]
+    assert_bytes_in_step(client)
+
+
+def test_multibyte_content_counts_utf8_bytes():
+    client = CustomMCPClient(None)
+    client.max_history_bytes = 20
+    client.append_message("user", "☸" * 5)  # 15 bytes
+    assert client._history_bytes == 15
+
+    client.append_message("user", "é" * 3)  # 6 bytes, pushes out the first
+    assert [m.content for m in client.conversation_history] == ["é" * 3]
+    assert_bytes_in_step(client)
+
+
+def test_clear_history_resets_byte_count():
+    client = CustomMCPClient(None)
+    for _ in range(5):
+        client.append_message("user", "x" * 100)
+    client.clear_history()
+
+    assert len(client.conversation_history) == 0
+    assert client._history_bytes == 0
+
+    client.append_message("user", "x" * 10)
+    assert_bytes_in_step(client)
+
+
+def test_shrinking_max_history_keeps_newest_messages():
+    client = CustomMCPClient(None)
+    for i in range(10):
+        client.append_message("user", str(i) * (i + 1))
+    client.max_history = 5
+
+    assert [m.content[0] for m in client.conversation_history] == list("56789")
+    assert_bytes_in_step(client)
+
+    client.append_message("user", "a")
+    assert len(client.conversation_history) == 5
+    assert_bytes_in_step(client)
+
+
+def test_zero_max_history_keeps_no_messages():
+    client = CustomMCPClient(None)
+    client.append_message("user", "x" * 10)
+    client.max_history = 0
+    client.append_message("user", "x")
+
+    assert len(client.conversation_history) == 0
+    assert client._history_bytes == 0
+
+
+def test_negative_max_history_is_rejected():
+    client = CustomMCPClient(None)
+    with pytest.raises(ValueError, match="max_history"):
+        client.max_history = -1
+    assert client.max_history == 20
+
+
+def test_import_does_not_load_mcp_or_aiohttp():
+    # A fresh interpreter, since other tests may already have imported them
+    code = (
+        "import sys, mcp_client.client; "
+        "print(sorted({'mcp', 'aiohttp'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_client_module_defines_each_class_once():
+    # Read the file next to the package so this also works for the mypyc build
+    source = (Path(mcp_client.__file__).parent / "client.py").read_text("utf-8")
+    for name in ("Message", "CustomMCPClient"):
+        assert len(re.findall(rf"^class {name}\b", source, re.MULTILINE)) == 1